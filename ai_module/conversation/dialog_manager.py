@@ -11,18 +11,40 @@ from dateutil import parser as date_parser
 from zoneinfo import ZoneInfo
 from groq import Groq
 
+from .prompt_registry import DEFAULT_TENANT, prompt_registry
+
 # 한국 타임존 설정
 KST = ZoneInfo("Asia/Seoul")
 
+# 주문 데이터 블록 태그
+ORDER_DATA_START = "[ORDER_DATA]"
+ORDER_DATA_END = "[/ORDER_DATA]"
+
+# 단계별 출력 토큰 예산
+QUESTION_MAX_TOKENS = 120       # 짧은 질문/확인 응답
+ORDER_DATA_MAX_TOKENS = 400     # ORDER_DATA 블록이 예상되는 턴
+CONTINUATION_MAX_TOKENS = 300   # 토큰 한도로 잘린 응답 이어쓰기
+
+# 배달 날짜/시간 관련 표현 (ORDER_DATA 블록이 나올 수 있는 턴 판별용)
+DELIVERY_DATE_PATTERN = re.compile(r"오늘|내일|모레|오전|오후|\d+\s*시|\d{1,2}:\d{2}|\d+\s*월|\d+\s*일")
+DELIVERY_QUESTION_PATTERN = re.compile(r"언제|배달|배송|날짜")
+
 
 class DialogManager:
     """대화 관리 클래스 (Groq API)"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[Groq] = None,
+        tenant_id: str = DEFAULT_TENANT,
+    ):
         """
         초기화
         Args:
             api_key: Groq API 키 (None이면 환경변수에서 로드)
+            client: 재사용할 Groq 클라이언트 (None이면 새로 생성)
+            tenant_id: 프롬프트 레지스트리 테넌트 ID
         """
 
         # API 키 로드
@@ -30,8 +52,8 @@ class DialogManager:
         if not self.api_key:
             raise ValueError("GROQ_API_KEY가 설정되지 않았습니다. .env 파일을 확인하세요.")
 
-        # Groq 클라이언트 초기화
-        self.client = Groq(api_key=self.api_key)
+        # Groq 클라이언트 초기화 (주어지면 공유)
+        self.client = client or Groq(api_key=self.api_key)
 
         # 사용할 모델 (Llama 3.3 70B)
         self.model_name = "llama-3.3-70b-versatile"
@@ -40,26 +62,20 @@ class DialogManager:
         self.order_context: Dict = {}
         self.customer_name: str = ""
 
-        # 시스템 프롬프트 파일에서 로드
-        self.system_prompt = self._load_system_prompt()
-
-    def _load_system_prompt(self) -> str:
-        """
-        시스템 프롬프트를 파일에서 로드
-        Returns:
-            시스템 프롬프트 문자열
-        """
-        # 현재 파일의 디렉토리 경로
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        prompt_path = os.path.join(current_dir, "system_prompt.txt")
-
-        try:
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except FileNotFoundError:
-            raise FileNotFoundError(f"시스템 프롬프트 파일을 찾을 수 없습니다: {prompt_path}")
-        except Exception as e:
-            raise Exception(f"시스템 프롬프트 로드 중 오류 발생: {e}")
+        # 시스템 프롬프트는 레지스트리의 공유 문자열 사용 (핫 리로드 반영)
+        self.tenant_id = tenant_id
+        # 마지막으로 조회한 프롬프트 (리로드로 테넌트가 삭제돼도 진행 중인 대화 유지)
+        self.last_system_prompt: Optional[str] = prompt_registry.find(tenant_id)
+
+    @property
+    def system_prompt(self) -> str:
+        """현재 테넌트의 시스템 프롬프트 (테넌트가 삭제됐으면 마지막 프롬프트)"""
+        prompt = prompt_registry.find(self.tenant_id)
+        if prompt is not None:
+            self.last_system_prompt = prompt
+        elif self.last_system_prompt is None:
+            raise KeyError(f"알 수 없는 테넌트입니다: {self.tenant_id}")
+        return self.last_system_prompt
 
     def start_conversation(self, customer_name: str) -> str:
         """
@@ -118,16 +134,30 @@ class DialogManager:
             # 현재 사용자 입력 추가
             messages.append({"role": "user", "content": user_input})
 
-            # Groq API 호출
-            chat_completion = self.client.chat.completions.create(
-                messages=messages,
-                model=self.model_name,
-                temperature=0.3,  # 낮춰서 더 일관된 출력
-                max_tokens=200,   # 짧게 답변하도록
-                top_p=0.9,
-            )
+            # 단계에 맞는 출력 예산으로 Groq API 호출 ([/ORDER_DATA]에서 생성 중단)
+            max_tokens = self._choose_max_tokens(user_input)
+            assistant_message, finish_reason = self._create_completion(messages, max_tokens)
+
+            # 응답(일반 문장 또는 ORDER_DATA 블록)이 토큰 한도로 잘렸으면 한 번만 이어서 생성
+            if finish_reason == "length":
+                continuation, finish_reason = self._create_completion(
+                    messages + [{"role": "assistant", "content": assistant_message}],
+                    CONTINUATION_MAX_TOKENS
+                )
+                assistant_message += continuation
+
+                if finish_reason == "length":
+                    print(f"응답 잘림: 이어쓰기 후에도 토큰 한도 도달 (max_tokens={max_tokens})")
 
-            assistant_message = chat_completion.choices[0].message.content.strip()
+            # 정지 시퀀스는 응답에 포함되지 않으므로 닫는 태그 복원
+            if (
+                finish_reason == "stop"
+                and ORDER_DATA_START in assistant_message
+                and ORDER_DATA_END not in assistant_message
+            ):
+                assistant_message = assistant_message.rstrip() + "\n" + ORDER_DATA_END
+
+            assistant_message = assistant_message.strip()
 
             # 대화 기록에 추가
             self.conversation_history.append({"role": "user", "content": user_input})
@@ -141,7 +171,7 @@ class DialogManager:
                 self.update_order_context(order_data)
 
             # 주문 데이터 부분 제거한 깨끗한 응답
-            clean_response = assistant_message.split("[ORDER_DATA]")[0].strip()
+            clean_response = assistant_message.split(ORDER_DATA_START)[0].strip()
 
             return clean_response, order_data
 
@@ -149,6 +179,48 @@ class DialogManager:
             error_msg = f"죄송합니다. 오류가 발생했습니다: {e}"
             return error_msg, None
 
+    def _create_completion(self, messages: List[Dict[str, str]], max_tokens: int) -> Tuple[str, Optional[str]]:
+        """
+        Groq API 호출
+        Args:
+            messages: 요청 메시지 목록
+            max_tokens: 최대 출력 토큰 수
+        Returns:
+            (생성된 텍스트, finish_reason)
+        """
+        chat_completion = self.client.chat.completions.create(
+            messages=messages,
+            model=self.model_name,
+            temperature=0.3,  # 낮춰서 더 일관된 출력
+            max_tokens=max_tokens,
+            top_p=0.9,
+            stop=[ORDER_DATA_END],
+        )
+
+        choice = chat_completion.choices[0]
+        return choice.message.content or "", choice.finish_reason
+
+    def _choose_max_tokens(self, user_input: str) -> int:
+        """
+        대화 단계에 따라 출력 토큰 예산 결정
+        배달 날짜를 묻거나 답하는 턴에만 ORDER_DATA 블록용 큰 예산 사용
+        Args:
+            user_input: 사용자 발화
+        Returns:
+            max_tokens 값
+        """
+        if DELIVERY_DATE_PATTERN.search(user_input):
+            return ORDER_DATA_MAX_TOKENS
+
+        # 직전 어시스턴트 응답이 배달 날짜 질문이면 다음 턴에 주문 완료 가능
+        for msg in reversed(self.conversation_history):
+            if msg["role"] == "assistant":
+                if DELIVERY_QUESTION_PATTERN.search(msg["content"]):
+                    return ORDER_DATA_MAX_TOKENS
+                break
+
+        return QUESTION_MAX_TOKENS
+
     def _extract_order_data(self, message: str) -> Optional[Dict]:
         """
         메시지에서 주문 데이터 추출
@@ -158,9 +230,9 @@ class DialogManager:
             주문 데이터 딕셔너리 또는 None
         """
         try:
-            if "[ORDER_DATA]" in message and "[/ORDER_DATA]" in message:
-                start = message.index("[ORDER_DATA]") + len("[ORDER_DATA]")
-                end = message.index("[/ORDER_DATA]")
+            if ORDER_DATA_START in message and ORDER_DATA_END in message:
+                start = message.index(ORDER_DATA_START) + len(ORDER_DATA_START)
+                end = message.index(ORDER_DATA_END)
                 json_str = message[start:end].strip()
                 order_data = json.loads(json_str)
 
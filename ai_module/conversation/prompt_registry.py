@@ -0,0 +1,188 @@
+"""
+테넌트(매장)별 시스템 프롬프트 레지스트리
+프로세스당 프롬프트 한 벌만 로드해 모든 세션이 공유하고, 핫 리로드 지원
+"""
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# 기본 테넌트 (기존 system_prompt.txt)
+DEFAULT_TENANT = "default"
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PROMPT_PATH = os.path.join(CURRENT_DIR, "system_prompt.txt")
+DEFAULT_TENANTS_DIR = os.path.join(CURRENT_DIR, "tenants")
+
+
+class PromptRegistry:
+    """테넌트별 시스템 프롬프트 레지스트리 클래스"""
+
+    def __init__(self, default_prompt_path: str = DEFAULT_PROMPT_PATH,
+                 tenants_dir: Optional[str] = None):
+        """
+        초기화
+        Args:
+            default_prompt_path: 기본 테넌트 프롬프트 파일 경로
+            tenants_dir: 테넌트 프롬프트 디렉토리 (<tenant_id>.txt, None이면 PROMPT_TENANTS_DIR 환경변수)
+        """
+        self.default_prompt_path = default_prompt_path
+        self._tenants_dir = tenants_dir
+
+        # 불변 스냅샷 (리로드 시 통째로 교체)
+        self._prompts: Dict[str, str] = {}
+        self._mtimes: Dict[str, float] = {}
+        self.version = 0
+        self.loaded_at: Optional[datetime] = None
+
+        self._reload_lock = threading.Lock()
+        self._watch_stop: Optional[threading.Event] = None
+
+    @property
+    def tenants_dir(self) -> str:
+        """테넌트 프롬프트 디렉토리 (.env 로드 이후 값 반영)"""
+        return self._tenants_dir or os.getenv("PROMPT_TENANTS_DIR", DEFAULT_TENANTS_DIR)
+
+    def _discover(self) -> Dict[str, str]:
+        """
+        테넌트 ID -> 프롬프트 파일 경로 목록
+        """
+        paths = {DEFAULT_TENANT: self.default_prompt_path}
+
+        if os.path.isdir(self.tenants_dir):
+            for name in sorted(os.listdir(self.tenants_dir)):
+                if name.endswith(".txt"):
+                    paths[name[:-len(".txt")]] = os.path.join(self.tenants_dir, name)
+
+        return paths
+
+    def _read(self, path: str) -> str:
+        """
+        프롬프트 파일 읽기
+        (매 턴 붙는 날짜/고객/주문 상태는 DialogManager에서 추가)
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"시스템 프롬프트 파일을 찾을 수 없습니다: {path}")
+        except Exception as e:
+            raise Exception(f"시스템 프롬프트 로드 중 오류 발생: {e}")
+
+    def reload(self) -> int:
+        """
+        모든 테넌트 프롬프트를 다시 로드해 원자적으로 교체
+        하나라도 실패하면 기존 프롬프트를 그대로 유지
+        Returns:
+            새 버전 번호
+        """
+        with self._reload_lock:
+            paths = self._discover()
+
+            prompts = {}
+            mtimes = {}
+            for tenant_id, path in paths.items():
+                text = self._read(path)
+                # 내용이 같으면 기존 문자열을 재사용해 한 벌만 유지
+                previous = self._prompts.get(tenant_id)
+                prompts[tenant_id] = previous if previous == text else text
+                mtimes[path] = os.path.getmtime(path)
+
+            self._prompts = prompts
+            self._mtimes = mtimes
+            self.version += 1
+            self.loaded_at = datetime.now()
+
+            print(f"[프롬프트 로드] v{self.version} - 테넌트 {len(prompts)}개")
+
+            return self.version
+
+    def _ensure_loaded(self):
+        """최초 사용 시 로드"""
+        if not self._prompts:
+            self.reload()
+
+    def get(self, tenant_id: str = DEFAULT_TENANT) -> str:
+        """
+        테넌트 프롬프트 조회 (공유 문자열 반환)
+        Args:
+            tenant_id: 테넌트 ID
+        Returns:
+            시스템 프롬프트
+        """
+        self._ensure_loaded()
+        try:
+            return self._prompts[tenant_id]
+        except KeyError:
+            raise KeyError(f"알 수 없는 테넌트입니다: {tenant_id}")
+
+    def find(self, tenant_id: str) -> Optional[str]:
+        """
+        테넌트 프롬프트 조회 (없으면 None)
+        Args:
+            tenant_id: 테넌트 ID
+        Returns:
+            시스템 프롬프트 또는 None
+        """
+        self._ensure_loaded()
+        return self._prompts.get(tenant_id)
+
+    def has_tenant(self, tenant_id: str) -> bool:
+        """테넌트 존재 여부"""
+        self._ensure_loaded()
+        return tenant_id in self._prompts
+
+    def list_tenants(self) -> List[Dict]:
+        """
+        로드된 테넌트 목록
+        Returns:
+            [{"tenant_id": ..., "size": ...}, ...]
+        """
+        self._ensure_loaded()
+        return [
+            {"tenant_id": tenant_id, "size": len(prompt)}
+            for tenant_id, prompt in self._prompts.items()
+        ]
+
+    def _changed(self) -> bool:
+        """프롬프트 파일 추가/삭제/수정 여부"""
+        try:
+            paths = self._discover()
+            if set(paths.values()) != set(self._mtimes):
+                return True
+            return any(os.path.getmtime(path) != mtime for path, mtime in self._mtimes.items())
+        except OSError:
+            return True
+
+    def start_watching(self, interval: float):
+        """
+        파일 변경 감시 시작 (interval초마다 mtime 확인 후 리로드)
+        Args:
+            interval: 확인 주기 (초)
+        """
+        if self._watch_stop is not None:
+            return
+
+        self._ensure_loaded()
+        stop = threading.Event()
+        self._watch_stop = stop
+
+        def watch():
+            while not stop.wait(interval):
+                if self._changed():
+                    try:
+                        self.reload()
+                    except Exception as e:
+                        print(f"[프롬프트 리로드 실패] {e}")
+
+        threading.Thread(target=watch, name="prompt-registry-watcher", daemon=True).start()
+
+    def stop_watching(self):
+        """파일 변경 감시 중지"""
+        if self._watch_stop is not None:
+            self._watch_stop.set()
+            self._watch_stop = None
+
+
+# 싱글톤 인스턴스
+prompt_registry = PromptRegistry()
@@ -0,0 +1,24 @@
+"""
+환경변수 설정 헬퍼
+"""
+import os
+
+
+def env_number(name: str, default, cast):
+    """
+    숫자 환경변수 로드 (잘못된 값이면 경고 후 기본값 사용)
+    Args:
+        name: 환경변수 이름
+        default: 없거나 잘못됐을 때 사용할 기본값
+        cast: 변환 함수 (int, float)
+    Returns:
+        변환된 값 또는 기본값
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        print(f"[설정] {name} 값이 올바르지 않아 기본값 {default} 사용: {value}")
+        return default
@@ -5,8 +5,11 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from dotenv import load_dotenv
 
-from .routes import chat_router
+from .config import env_number
+from .routes import chat_router, admin_router
 from .services.session_manager import session_manager
+from .services.profiler import profiler
+from ai_module.conversation.prompt_registry import prompt_registry
 
 # 환경 변수 로드
 load_dotenv()
@@ -16,17 +19,29 @@ load_dotenv()
 async def lifespan(app: FastAPI):
     """앱 생명주기 관리"""
     # 시작 시 실행
+    profiler.configure()  # .env 로드 이후 설정 반영
+
+    # 모든 매장 프롬프트 미리 로드 (프로세스당 한 벌)
+    prompt_registry.reload()
+    watch_interval = env_number("PROMPT_WATCH_INTERVAL", 0.0, float)
+    if watch_interval > 0:
+        prompt_registry.start_watching(watch_interval)
+
     print("\n" + "="*60)
     print("  Dinner Bot Text API Server Starting...")
     print("="*60)
     print("[알림] Groq API 사용")
     print("       - 텍스트 입력: 프론트엔드에서 처리")
     print("       - 대화 모델: Llama 3.3 70B")
+    print(f"[알림] 매장 프롬프트: {', '.join(t['tenant_id'] for t in prompt_registry.list_tenants())}")
+    if profiler.sample_rate > 0:
+        print(f"[알림] 프로파일링 샘플링: {profiler.sample_rate} -> {profiler.profile_dir}")
     print("="*60 + "\n")
 
     yield
 
     # 종료 시 실행
+    prompt_registry.stop_watching()
     print("\n서버 종료 중...")
 
 
@@ -40,6 +55,7 @@ app = FastAPI(
 
 # 라우터 등록
 app.include_router(chat_router)
+app.include_router(admin_router)
 
 
 @app.get("/")
@@ -50,8 +66,13 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "start_chat": "POST /api/chat/start",
+            "start_chat_bulk": "POST /api/chat/start/bulk",
             "send_message": "POST /api/chat/message (텍스트 입력)",
-            "reset_chat": "POST /api/chat/reset/{session_id}"
+            "send_batch": "POST /api/chat/batch (NDJSON 스트림)",
+            "get_transcript": "GET /api/chat/transcript/{session_id}",
+            "reset_chat": "POST /api/chat/reset/{session_id}",
+            "list_profiles": "GET /api/admin/profiles (X-Admin-Token)",
+            "reload_prompts": "POST /api/admin/prompts/reload (X-Admin-Token)"
         }
     }
 
@@ -61,5 +82,6 @@ async def health_check():
     """헬스 체크"""
     return {
         "status": "healthy",
-        "active_sessions": session_manager.get_active_sessions_count()
+        "active_sessions": session_manager.get_active_sessions_count(),
+        "session_memory": session_manager.get_memory_stats()
     }
@@ -6,11 +6,23 @@ from .schemas import (
     StartChatResponse,
     ChatMessageRequest,
     ChatMessageResponse,
+    BulkStartChatRequest,
+    BulkStartChatResponse,
+    BatchTurn,
+    BatchMessageRequest,
+    BatchTurnResult,
+    TranscriptResponse,
 )
 
 __all__ = [
     "StartChatRequest",
     "StartChatResponse",
     "ChatMessageRequest",
-    "ChatMessageResponse"
+    "ChatMessageResponse",
+    "BulkStartChatRequest",
+    "BulkStartChatResponse",
+    "BatchTurn",
+    "BatchMessageRequest",
+    "BatchTurnResult",
+    "TranscriptResponse"
 ]
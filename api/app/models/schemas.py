@@ -1,13 +1,19 @@
 """
 Chat API Pydantic Models
 """
-from typing import Dict, Optional
-from pydantic import BaseModel
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from ai_module.conversation.prompt_registry import DEFAULT_TENANT
+
+# 배치/일괄 요청 한 번에 받을 수 있는 최대 항목 수
+MAX_BATCH_SIZE = 100
 
 
 class StartChatRequest(BaseModel):
     """대화 시작 요청"""
     customer_name: str
+    tenant_id: str = DEFAULT_TENANT
 
 
 class StartChatResponse(BaseModel):
@@ -28,3 +34,39 @@ class ChatMessageResponse(BaseModel):
     recognized_text: Optional[str] = None
     order_data: Optional[Dict] = None
     is_completed: bool = False
+
+
+class BulkStartChatRequest(BaseModel):
+    """대화 일괄 시작 요청"""
+    customer_names: List[str] = Field(max_length=MAX_BATCH_SIZE)
+    tenant_id: str = DEFAULT_TENANT
+
+
+class BulkStartChatResponse(BaseModel):
+    """대화 일괄 시작 응답 (요청 순서 유지)"""
+    sessions: List[StartChatResponse]
+
+
+class BatchTurn(BaseModel):
+    """배치 요청의 단일 턴"""
+    session_id: str
+    text: str
+
+
+class BatchMessageRequest(BaseModel):
+    """배치 메시지 요청 (여러 세션의 턴 포함 가능)"""
+    turns: List[BatchTurn] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class BatchTurnResult(BaseModel):
+    """배치 턴 처리 결과 (NDJSON 한 줄)"""
+    index: int
+    session_id: str
+    response: Optional[ChatMessageResponse] = None
+    error: Optional[str] = None
+
+
+class TranscriptResponse(BaseModel):
+    """대화 기록 응답 (압축 보관된 이전 메시지 포함)"""
+    session_id: str
+    messages: List[Dict[str, str]]
@@ -0,0 +1,103 @@
+"""
+Admin API Routes
+"""
+import hmac
+import os
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+
+from ..services.profiler import profiler
+from ai_module.conversation.prompt_registry import prompt_registry
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+def is_admin_token(x_admin_token: Optional[str]) -> bool:
+    """
+    관리자 토큰 일치 여부 (ADMIN_TOKEN 환경변수가 없으면 항상 False)
+    """
+    admin_token = os.getenv("ADMIN_TOKEN")
+    if not admin_token or not x_admin_token:
+        return False
+    return hmac.compare_digest(x_admin_token, admin_token)
+
+
+def verify_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """
+    관리자 토큰 확인 (ADMIN_TOKEN 환경변수가 없으면 관리자 API 비활성)
+    """
+    if not os.getenv("ADMIN_TOKEN"):
+        raise HTTPException(status_code=403, detail="관리자 API가 비활성화되어 있습니다.")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 올바르지 않습니다.")
+
+
+def admin_profile_header(
+    x_profile: Optional[str] = Header(None),
+    x_admin_token: Optional[str] = Header(None),
+) -> Optional[str]:
+    """
+    X-Profile 헤더는 관리자 토큰이 있을 때만 인정 (없으면 샘플링만 적용)
+    """
+    return x_profile if is_admin_token(x_admin_token) else None
+
+
+@router.get("/profiles", dependencies=[Depends(verify_admin_token)])
+async def list_profiles():
+    """
+    저장된 프로파일 목록
+    Returns:
+        프로파일 파일 목록 (최신순)
+    """
+    return {
+        "profile_dir": profiler.profile_dir,
+        "sample_rate": profiler.sample_rate,
+        "profiles": profiler.list_profiles()
+    }
+
+
+@router.get("/profiles/{name}", dependencies=[Depends(verify_admin_token)])
+async def download_profile(name: str):
+    """
+    프로파일 파일 다운로드
+    Args:
+        name: 파일명 (.prof 또는 .txt)
+    Returns:
+        파일
+    """
+    path = profiler.get_profile_path(name)
+    if not path:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+
+    return FileResponse(path, filename=name)
+
+
+@router.get("/prompts", dependencies=[Depends(verify_admin_token)])
+async def list_prompts():
+    """
+    로드된 매장(테넌트) 프롬프트 목록
+    Returns:
+        프롬프트 버전 및 테넌트 목록
+    """
+    return {
+        "version": prompt_registry.version,
+        "loaded_at": prompt_registry.loaded_at.isoformat(timespec="seconds") if prompt_registry.loaded_at else None,
+        "tenants": prompt_registry.list_tenants()
+    }
+
+
+@router.post("/prompts/reload", dependencies=[Depends(verify_admin_token)])
+async def reload_prompts():
+    """
+    프롬프트 핫 리로드 (진행 중인 세션은 다음 턴부터 새 프롬프트 사용)
+    Returns:
+        새 프롬프트 버전
+    """
+    try:
+        version = prompt_registry.reload()
+    except Exception as e:
+        print(f"[오류] 프롬프트 리로드 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"프롬프트 리로드 실패: {str(e)}")
+
+    return {"version": version, "tenants": prompt_registry.list_tenants()}
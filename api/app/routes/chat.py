@@ -1,31 +1,112 @@
 """
 Chat API Routes
 """
+import asyncio
 from datetime import datetime
-from fastapi import APIRouter, HTTPException
+from typing import Callable, Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from ..models.schemas import (
     StartChatRequest,
     StartChatResponse,
     ChatMessageRequest,
-    ChatMessageResponse
+    ChatMessageResponse,
+    BulkStartChatRequest,
+    BulkStartChatResponse,
+    BatchMessageRequest,
+    BatchTurnResult,
+    TranscriptResponse
 )
 from ..services.session_manager import session_manager
+from ..services.session_state import SessionState
+from ..services.profiler import profiler
+from .admin import admin_profile_header
+from ai_module.conversation.prompt_registry import prompt_registry
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
+# 모든 배치 요청이 동시에 스레드풀에서 실행할 수 있는 최대 턴 수
+# (기본 스레드풀 40개 중 나머지는 단건 메시지/대화 기록 조회용으로 남김)
+BATCH_MAX_CONCURRENCY = 8
+batch_semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+
+
+def _process_turn(session_id: str, session: SessionState, user_text: str) -> ChatMessageResponse:
+    """
+    단일 턴 처리 (단건/배치 공용)
+    Args:
+        session_id: 세션 ID
+        session: 세션 상태
+        user_text: 공백 제거된 사용자 입력
+    Returns:
+        AI 응답 텍스트 및 주문 데이터
+    """
+    print(f"[세션 {session_id}] 사용자 입력: {user_text}")
+
+    # AI 응답 생성 (턴 동안만 DialogManager 생성, 대화 기록은 세션 상태에 반영)
+    with session_manager.checkout(session) as dialog_manager:
+        response_text, order_data = dialog_manager.process_user_input(user_text)
+
+    # order_data의 datetime 객체를 문자열로 변환 (JSON 직렬화를 위해)
+    if order_data and "delivery_date" in order_data and order_data["delivery_date"]:
+        if isinstance(order_data["delivery_date"], datetime):
+            delivery_dt = order_data["delivery_date"]
+            # 시간이 00:00:00이면 날짜만, 아니면 날짜와 시간 모두 포함
+            if delivery_dt.hour == 0 and delivery_dt.minute == 0:
+                order_data["delivery_date"] = delivery_dt.strftime("%Y-%m-%d")
+            else:
+                order_data["delivery_date"] = delivery_dt.strftime("%Y-%m-%d %H:%M")
+
+    # 주문 완료 여부 확인
+    is_completed = False
+    if order_data and "delivery_date" in order_data and order_data["delivery_date"]:
+        is_completed = True
+        print(f"[세션 {session_id}] 주문 완료!")
+
+        # 주문 완료 시 응답이 비어있으면 완료 메시지 추가
+        if not response_text or response_text.strip() == "":
+            customer_name = session.customer_name or "고객"
+            response_text = f"{customer_name}님, 주문이 완료되었습니다! 주문하신 내용대로 배송해드리겠습니다. 감사합니다."
+
+    print(f"[세션 {session_id}] AI 응답: {response_text}")
+
+    return ChatMessageResponse(
+        text=response_text,
+        recognized_text=user_text,
+        order_data=order_data,
+        is_completed=is_completed
+    )
+
+
+def _process_turn_profiled(label: str, session_id: str, session: SessionState, user_text: str,
+                           x_profile: Optional[str],
+                           serialize: Callable[[ChatMessageResponse], str]) -> str:
+    """
+    스레드풀에서 실행되는 턴 (프로파일러가 해당 스레드에 걸리도록 내부에서 감쌈)
+    응답 직렬화까지 프로파일 범위에 포함
+    Returns:
+        직렬화된 응답 JSON
+    """
+    with profiler.maybe_profile(label, x_profile):
+        return serialize(_process_turn(session_id, session, user_text))
+
 
 @router.post("/start", response_model=StartChatResponse)
 async def start_chat(request: StartChatRequest):
     """
     대화 시작
     Args:
-        request: 고객 이름
+        request: 고객 이름 및 매장(테넌트) ID
     Returns:
         세션 ID와 인사 메시지
     """
+    if not prompt_registry.has_tenant(request.tenant_id):
+        raise HTTPException(status_code=400, detail=f"알 수 없는 매장입니다: {request.tenant_id}")
+
     try:
-        session_id, greeting = session_manager.create_session(request.customer_name)
+        session_id, greeting = session_manager.create_session(request.customer_name, request.tenant_id)
 
         return StartChatResponse(
             session_id=session_id,
@@ -37,12 +118,40 @@ async def start_chat(request: StartChatRequest):
         raise HTTPException(status_code=500, detail=f"대화 시작 실패: {str(e)}")
 
 
+@router.post("/start/bulk", response_model=BulkStartChatResponse)
+async def start_chat_bulk(request: BulkStartChatRequest):
+    """
+    대화 일괄 시작
+    Args:
+        request: 고객 이름 목록 및 매장(테넌트) ID
+    Returns:
+        요청 순서대로 세션 ID와 인사 메시지 목록
+    """
+    if not prompt_registry.has_tenant(request.tenant_id):
+        raise HTTPException(status_code=400, detail=f"알 수 없는 매장입니다: {request.tenant_id}")
+
+    try:
+        created = session_manager.create_sessions(request.customer_names, request.tenant_id)
+
+        return BulkStartChatResponse(
+            sessions=[
+                StartChatResponse(session_id=session_id, greeting=greeting)
+                for session_id, greeting in created
+            ]
+        )
+
+    except Exception as e:
+        print(f"[오류] 대화 일괄 시작 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"대화 일괄 시작 실패: {str(e)}")
+
+
 @router.post("/message", response_model=ChatMessageResponse)
-async def send_message(request: ChatMessageRequest):
+async def send_message(request: ChatMessageRequest, x_profile: Optional[str] = Depends(admin_profile_header)):
     """
     텍스트 메시지 전송
     Args:
         request: 세션 ID 및 텍스트 메시지
+        x_profile: "1"이면 이 요청을 프로파일링 (X-Admin-Token 일치 시에만)
     Returns:
         AI 응답 텍스트 및 주문 데이터
     """
@@ -51,55 +160,18 @@ async def send_message(request: ChatMessageRequest):
     if not session:
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
 
-    dialog_manager = session["dialog_manager"]
-
     try:
         user_text = request.text.strip()
 
         if not user_text:
             raise HTTPException(status_code=400, detail="텍스트가 비어있습니다.")
 
-        print(f"[세션 {request.session_id}] 사용자 입력: {user_text}")
-
-        # AI 응답 생성
-        response_text, order_data = dialog_manager.process_user_input(user_text)
-
-        # order_data의 datetime 객체를 문자열로 변환 (JSON 직렬화를 위해)
-        if order_data and "delivery_date" in order_data and order_data["delivery_date"]:
-            if isinstance(order_data["delivery_date"], datetime):
-                delivery_dt = order_data["delivery_date"]
-                # 시간이 00:00:00이면 날짜만, 아니면 날짜와 시간 모두 포함
-                if delivery_dt.hour == 0 and delivery_dt.minute == 0:
-                    order_data["delivery_date"] = delivery_dt.strftime("%Y-%m-%d")
-                else:
-                    order_data["delivery_date"] = delivery_dt.strftime("%Y-%m-%d %H:%M")
-
-        # 주문 완료 여부 확인
-        is_completed = False
-        if order_data and "delivery_date" in order_data and order_data["delivery_date"]:
-            is_completed = True
-            print(f"[세션 {request.session_id}] 주문 완료!")
-
-            # 주문 완료 시 응답이 비어있으면 완료 메시지 추가
-            if not response_text or response_text.strip() == "":
-                customer_name = session.get("customer_name", "고객")
-                response_text = f"{customer_name}님, 주문이 완료되었습니다! 주문하신 내용대로 배송해드리겠습니다. 감사합니다."
-
-        print(f"[세션 {request.session_id}] AI 응답: {response_text}")
-
-        # 대화 히스토리 저장
-        session["conversation_history"].append({
-            "user": user_text,
-            "assistant": response_text,
-            "order_data": order_data
-        })
-
-        return ChatMessageResponse(
-            text=response_text,
-            recognized_text=user_text,
-            order_data=order_data,
-            is_completed=is_completed
+        # Groq 호출이 블로킹이므로 스레드풀에서 실행 (이벤트 루프와 배치 스트림 차단 방지)
+        body = await run_in_threadpool(
+            _process_turn_profiled, "send_message", request.session_id, session, user_text, x_profile,
+            lambda response: response.model_dump_json()
         )
+        return Response(content=body, media_type="application/json")
 
     except HTTPException:
         raise
@@ -110,6 +182,94 @@ async def send_message(request: ChatMessageRequest):
         raise HTTPException(status_code=500, detail=f"메시지 처리 실패: {str(e)}")
 
 
+@router.post("/batch")
+async def send_batch(request: BatchMessageRequest, x_profile: Optional[str] = Depends(admin_profile_header)):
+    """
+    배치 메시지 전송
+    서로 다른 세션은 동시에(전체 배치 합산 최대 BATCH_MAX_CONCURRENCY턴), 같은 세션의 턴은 요청 순서대로 처리
+    (다른 요청과 겹치는 같은 세션의 턴은 세션 잠금으로 직렬화)
+    Args:
+        request: (세션 ID, 텍스트) 턴 목록 (최대 MAX_BATCH_SIZE개)
+        x_profile: "1"이면 각 턴을 프로파일링 (X-Admin-Token 일치 시에만, 동시 실행 중인 턴은 제외)
+    Returns:
+        턴이 끝나는 순서대로 BatchTurnResult를 한 줄씩 담은 NDJSON 스트림
+    """
+    # 세션별로 턴 묶기 (세션 내 순서 유지)
+    turns_by_session: Dict[str, List[Tuple[int, str]]] = {}
+    for index, turn in enumerate(request.turns):
+        turns_by_session.setdefault(turn.session_id, []).append((index, turn.text))
+
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run_session(session_id: str, turns: List[Tuple[int, str]]):
+        for index, text in turns:
+            result = BatchTurnResult(index=index, session_id=session_id)
+            line = None
+
+            def serialize(response: ChatMessageResponse, result=result) -> str:
+                result.response = response
+                return result.model_dump_json()
+
+            try:
+                session = session_manager.get_session(session_id)
+                user_text = text.strip()
+
+                if not session:
+                    result.error = "세션을 찾을 수 없습니다."
+                elif not user_text:
+                    result.error = "텍스트가 비어있습니다."
+                else:
+                    # Groq 호출이 블로킹이므로 스레드풀에서 실행 (직렬화까지 스레드에서 수행)
+                    # 배치 전체의 동시 실행 수를 제한해 스레드풀 독점 방지
+                    async with batch_semaphore:
+                        line = await run_in_threadpool(
+                            _process_turn_profiled, "batch_turn", session_id, session, user_text, x_profile,
+                            serialize
+                        )
+            except Exception as e:
+                print(f"[오류] 배치 메시지 처리 실패: {e}")
+                result.response = None
+                result.error = f"메시지 처리 실패: {str(e)}"
+            finally:
+                # 어떤 경우에도 턴마다 한 줄을 보내야 stream()이 끝남
+                await queue.put(line or result.model_dump_json())
+
+    async def stream():
+        tasks = [
+            asyncio.create_task(run_session(session_id, turns))
+            for session_id, turns in turns_by_session.items()
+        ]
+        try:
+            for _ in range(len(request.turns)):
+                line = await queue.get()
+                yield line + "\n"
+        finally:
+            # 클라이언트 연결이 끊기면 남은 작업 취소
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.get("/transcript/{session_id}", response_model=TranscriptResponse)
+async def get_transcript(session_id: str):
+    """
+    대화 기록 조회
+    Args:
+        session_id: 세션 ID
+    Returns:
+        전체 대화 기록 (어시스턴트 메시지는 ORDER_DATA 블록 포함 원문)
+    """
+    session = session_manager.get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+
+    # 진행 중인 턴이 있으면 세션 잠금을 기다리므로 스레드풀에서 실행
+    messages = await run_in_threadpool(session.transcript)
+
+    return TranscriptResponse(session_id=session_id, messages=messages)
+
+
 @router.post("/reset/{session_id}")
 async def reset_chat(session_id: str):
     """
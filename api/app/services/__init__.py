@@ -2,5 +2,7 @@
 Services Package
 """
 from .session_manager import SessionManager, session_manager
+from .session_state import SessionState
+from .profiler import RequestProfiler, profiler
 
-__all__ = ["SessionManager", "session_manager"]
+__all__ = ["SessionManager", "session_manager", "SessionState", "RequestProfiler", "profiler"]
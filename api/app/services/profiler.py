@@ -0,0 +1,200 @@
+"""
+Request Profiler Service
+요청 단위 cProfile + tracemalloc 프로파일링 (헤더 또는 샘플링으로 활성화)
+"""
+import cProfile
+import io
+import os
+import pstats
+import random
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ..config import env_number
+
+# 프로파일링을 요청하는 헤더 값
+PROFILE_HEADER_VALUES = {"1", "true", "yes", "on"}
+
+
+class RequestProfiler:
+    """요청 프로파일러 클래스"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.configure()
+
+    def configure(self):
+        """
+        환경변수에서 설정 로드
+        - PROFILE_SAMPLE_RATE: 0.0 ~ 1.0 샘플링 비율 (기본 0, 비활성)
+        - PROFILE_DIR: 프로파일 저장 디렉토리 (기본 ./profiles)
+        - PROFILE_MAX_FILES: 보관할 최대 프로파일 수 (기본 50)
+        - PROFILE_TRACE_FRAMES: tracemalloc 스택 깊이 (기본 10)
+        """
+        self.sample_rate = env_number("PROFILE_SAMPLE_RATE", 0.0, float)
+        self.profile_dir = os.path.abspath(os.getenv("PROFILE_DIR", "profiles"))
+        self.max_files = env_number("PROFILE_MAX_FILES", 50, int)
+        self.trace_frames = env_number("PROFILE_TRACE_FRAMES", 10, int)
+
+    def should_profile(self, header_value: Optional[str] = None) -> bool:
+        """
+        이번 요청을 프로파일링할지 결정
+        Args:
+            header_value: X-Profile 헤더 값
+        Returns:
+            프로파일링 여부
+        """
+        if header_value and header_value.strip().lower() in PROFILE_HEADER_VALUES:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def maybe_profile(self, label: str, header_value: Optional[str] = None):
+        """
+        샘플링된 경우에만 프로파일링하는 컨텍스트 매니저 반환
+        비활성 시에는 nullcontext라 오버헤드가 거의 없음
+        """
+        if self.should_profile(header_value):
+            return self.profile(label)
+        return nullcontext()
+
+    @contextmanager
+    def profile(self, label: str):
+        """
+        cProfile + tracemalloc로 블록 프로파일링 후 파일로 저장
+        tracemalloc은 프로세스 전역이므로 동시에 하나만 실행하고,
+        이미 실행 중이면 프로파일링 없이 진행
+        Args:
+            label: 프로파일 파일명에 들어갈 이름
+        """
+        if not self._lock.acquire(blocking=False):
+            yield
+            return
+
+        try:
+            was_tracing = tracemalloc.is_tracing()
+            if not was_tracing:
+                tracemalloc.start(self.trace_frames)
+            tracemalloc.reset_peak()
+
+            profile = cProfile.Profile()
+            start = time.perf_counter()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                elapsed = time.perf_counter() - start
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                if not was_tracing:
+                    tracemalloc.stop()
+
+                try:
+                    self._save(label, profile, snapshot, elapsed, peak)
+                except Exception as e:
+                    print(f"[프로파일] 저장 실패: {e}")
+        finally:
+            self._lock.release()
+
+    def _save(self, label: str, profile: cProfile.Profile,
+              snapshot: tracemalloc.Snapshot, elapsed: float, peak: int):
+        """
+        프로파일 저장 (.prof: pstats 바이너리, .txt: 사람이 읽는 요약)
+        """
+        os.makedirs(self.profile_dir, exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        base_name = f"{timestamp}_{label}_{uuid.uuid4().hex[:8]}"
+        base_path = os.path.join(self.profile_dir, base_name)
+
+        profile.dump_stats(base_path + ".prof")
+
+        stats_stream = io.StringIO()
+        pstats.Stats(profile, stream=stats_stream).sort_stats("cumulative").print_stats(30)
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+        alloc_lines = [str(stat) for stat in snapshot.statistics("lineno")[:20]]
+
+        with open(base_path + ".txt", "w", encoding="utf-8") as f:
+            f.write(f"label: {label}\n")
+            f.write(f"elapsed: {elapsed * 1000:.1f} ms\n")
+            f.write(f"peak traced memory: {peak / 1024:.1f} KiB\n\n")
+            f.write("=== cProfile (cumulative, top 30) ===\n")
+            f.write(stats_stream.getvalue())
+            f.write("\n=== tracemalloc (top 20 by line) ===\n")
+            f.write("\n".join(alloc_lines) + "\n")
+
+        print(f"[프로파일] {base_name} ({elapsed * 1000:.1f} ms)")
+
+        self._rotate()
+
+    def _rotate(self):
+        """오래된 프로파일 삭제 (max_files개만 유지)"""
+        names = sorted(
+            name[:-len(".prof")]
+            for name in os.listdir(self.profile_dir)
+            if name.endswith(".prof")
+        )
+        for base_name in names[:max(0, len(names) - self.max_files)]:
+            for ext in (".prof", ".txt"):
+                path = os.path.join(self.profile_dir, base_name + ext)
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def list_profiles(self) -> List[Dict]:
+        """
+        저장된 프로파일 파일 목록 (최신순)
+        Returns:
+            [{"name": ..., "size": ..., "modified": ...}, ...]
+        """
+        if not os.path.isdir(self.profile_dir):
+            return []
+
+        files = []
+        for name in os.listdir(self.profile_dir):
+            if not (name.endswith(".prof") or name.endswith(".txt")):
+                continue
+            path = os.path.join(self.profile_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                # 목록 조회 중 로테이션으로 삭제된 파일
+                continue
+            files.append({
+                "name": name,
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds")
+            })
+
+        files.sort(key=lambda f: f["name"], reverse=True)
+        return files
+
+    def get_profile_path(self, name: str) -> Optional[str]:
+        """
+        프로파일 파일 경로 조회 (목록에 있는 파일만 허용)
+        Args:
+            name: 파일명
+        Returns:
+            파일 경로 또는 None
+        """
+        if os.path.basename(name) != name:
+            return None
+        if not (name.endswith(".prof") or name.endswith(".txt")):
+            return None
+
+        path = os.path.join(self.profile_dir, name)
+        if not os.path.isfile(path):
+            return None
+        return path
+
+
+# 싱글톤 인스턴스
+profiler = RequestProfiler()
@@ -2,52 +2,102 @@
 Session Manager Service
 """
 import uuid
-from typing import Dict, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from groq import Groq
 
 from ai_module.conversation.dialog_manager import DialogManager
+from ai_module.conversation.prompt_registry import DEFAULT_TENANT
+from .session_state import SessionState
 
 
 class SessionManager:
     """세션 관리 클래스"""
 
     def __init__(self):
-        self.sessions: Dict[str, Dict] = {}
+        self.sessions: Dict[str, SessionState] = {}
+
+        # 모든 세션이 공유하는 Groq 클라이언트 (첫 세션 생성 시 초기화)
+        self._client: Optional[Groq] = None
 
-    def create_session(self, customer_name: str) -> tuple[str, str]:
+    def create_session(self, customer_name: str, tenant_id: str = DEFAULT_TENANT) -> tuple[str, str]:
         """
         새로운 세션 생성
         Args:
             customer_name: 고객 이름
+            tenant_id: 매장(테넌트) ID
         Returns:
             (session_id, greeting)
         """
+        session_id, greeting = self._create_session(customer_name, tenant_id)
+
+        print(f"[세션 생성] {session_id} - {customer_name}")
+
+        return session_id, greeting
+
+    def create_sessions(self, customer_names: List[str],
+                        tenant_id: str = DEFAULT_TENANT) -> List[tuple[str, str]]:
+        """
+        여러 세션을 한 번에 생성
+        Args:
+            customer_names: 고객 이름 목록
+            tenant_id: 매장(테넌트) ID
+        Returns:
+            [(session_id, greeting), ...] (입력 순서 유지)
+        """
+        results = [
+            self._create_session(customer_name, tenant_id)
+            for customer_name in customer_names
+        ]
+
+        print(f"[세션 일괄 생성] {len(results)}개")
+
+        return results
+
+    def _create_session(self, customer_name: str, tenant_id: str) -> tuple[str, str]:
+        """세션 생성 및 인사 메시지 반환"""
         # 세션 ID 생성
         session_id = str(uuid.uuid4())
 
-        # 대화 관리자 초기화
-        dialog_manager = DialogManager()
-
-        # 대화 시작
-        greeting = dialog_manager.start_conversation(customer_name)
+        # 세션 상태 초기화 및 대화 시작
+        state = SessionState(customer_name, tenant_id)
+        with self.checkout(state) as dialog_manager:
+            greeting = dialog_manager.start_conversation(customer_name)
 
         # 세션 저장
-        self.sessions[session_id] = {
-            "customer_name": customer_name,
-            "dialog_manager": dialog_manager,
-            "conversation_history": []
-        }
-
-        print(f"[세션 생성] {session_id} - {customer_name}")
+        self.sessions[session_id] = state
 
         return session_id, greeting
 
-    def get_session(self, session_id: str) -> Optional[Dict]:
+    @contextmanager
+    def checkout(self, state: SessionState) -> Iterator[DialogManager]:
+        """
+        턴 실행 동안만 DialogManager를 만들어 사용하고, 끝나면 압축 상태로 반영
+        같은 세션의 턴은 세션 잠금으로 한 번에 하나씩만 실행
+        (블로킹 잠금이므로 스레드풀에서 호출)
+        Args:
+            state: 세션 상태
+        Yields:
+            DialogManager
+        """
+        with state.lock:
+            dialog_manager = state.materialize(self._client)
+            if self._client is None:
+                self._client = dialog_manager.client
+
+            try:
+                yield dialog_manager
+            finally:
+                state.absorb(dialog_manager)
+
+    def get_session(self, session_id: str) -> Optional[SessionState]:
         """
         세션 조회
         Args:
             session_id: 세션 ID
         Returns:
-            세션 데이터 또는 None
+            세션 상태 또는 None
         """
         return self.sessions.get(session_id)
 
@@ -69,6 +119,20 @@ class SessionManager:
         """활성 세션 수 반환"""
         return len(self.sessions)
 
+    def get_memory_stats(self) -> Dict[str, int]:
+        """
+        세션 메모리 사용량 (공유 클라이언트/프롬프트 제외)
+        Returns:
+            {"total_bytes": ..., "bytes_per_session": ...}
+        """
+        total = sum(state.nbytes for state in list(self.sessions.values()))
+        count = len(self.sessions)
+
+        return {
+            "total_bytes": total,
+            "bytes_per_session": total // count if count else 0
+        }
+
 
 # 싱글톤 인스턴스
 session_manager = SessionManager()
@@ -0,0 +1,151 @@
+"""
+Compact Session State
+세션당 메모리를 줄인 대화 상태 표현
+- DialogManager는 턴 실행 중에만 생성 (클라이언트/프롬프트는 공유)
+- 최근 메시지는 (role, content) 튜플, 오래된 메시지는 zlib 압축 청크
+"""
+import json
+import sys
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from groq import Groq
+
+from ai_module.conversation.dialog_manager import DialogManager
+
+# 공유(intern)되는 역할 문자열
+ROLE_USER = sys.intern("user")
+ROLE_ASSISTANT = sys.intern("assistant")
+
+# DialogManager가 프롬프트에 넣는 최근 메시지 수 (이보다 오래된 메시지는 압축)
+RECENT_MESSAGES = 6
+
+# 최근 메시지가 이 수를 넘으면 한꺼번에 압축 (매 턴 재압축 방지)
+ARCHIVE_THRESHOLD = RECENT_MESSAGES * 2
+
+
+class SessionState:
+    """세션 상태 클래스 (__slots__)"""
+
+    __slots__ = (
+        "customer_name",
+        "tenant_id",
+        "system_prompt",
+        "order_context",
+        "recent",
+        "archive",
+        "nbytes",
+        "lock",
+    )
+
+    def __init__(self, customer_name: str, tenant_id: str):
+        """
+        초기화
+        Args:
+            customer_name: 고객 이름
+            tenant_id: 매장(테넌트) ID
+        """
+        self.customer_name = customer_name
+        self.tenant_id = sys.intern(tenant_id)
+        self.system_prompt: Optional[str] = None  # 레지스트리 문자열 참조 (사본 아님)
+        self.order_context: Optional[Dict] = None
+        self.recent: Tuple[Tuple[str, str], ...] = ()
+        self.archive: Tuple[bytes, ...] = ()  # 압축 청크 (추가만 하고 재압축하지 않음)
+        self.nbytes = 0
+
+        # materialize ~ absorb 사이를 직렬화 (같은 세션 동시 요청 시 턴 유실 방지)
+        self.lock = threading.Lock()
+
+    def materialize(self, client: Optional[Groq] = None) -> DialogManager:
+        """
+        턴 실행용 DialogManager 생성
+        Args:
+            client: 공유 Groq 클라이언트
+        Returns:
+            최근 메시지와 주문 컨텍스트가 채워진 DialogManager
+        """
+        dialog_manager = DialogManager(client=client, tenant_id=self.tenant_id)
+        if self.system_prompt is not None and dialog_manager.last_system_prompt is None:
+            # 테넌트가 리로드로 삭제됐으면 세션이 마지막으로 본 프롬프트 사용
+            dialog_manager.last_system_prompt = self.system_prompt
+        dialog_manager.customer_name = self.customer_name
+        dialog_manager.order_context = self.order_context or {}
+        dialog_manager.conversation_history = [
+            {"role": role, "content": content} for role, content in self.recent
+        ]
+        return dialog_manager
+
+    def absorb(self, dialog_manager: DialogManager):
+        """
+        턴 실행 후 DialogManager 상태를 압축 형태로 반영
+        Args:
+            dialog_manager: materialize()로 만든 DialogManager
+        """
+        self.customer_name = dialog_manager.customer_name
+        self.system_prompt = dialog_manager.last_system_prompt
+        self.order_context = {
+            sys.intern(key): value for key, value in dialog_manager.order_context.items()
+        } or None
+
+        messages = tuple(
+            (_intern_role(msg["role"]), msg["content"])
+            for msg in dialog_manager.conversation_history
+        )
+        if len(messages) > ARCHIVE_THRESHOLD:
+            self._archive_messages(messages[:-RECENT_MESSAGES])
+            messages = messages[-RECENT_MESSAGES:]
+        self.recent = messages
+
+        self.nbytes = self._measure()
+
+    def _archive_messages(self, messages: Tuple[Tuple[str, str], ...]):
+        """오래된 메시지를 압축 청크로 추가 (기존 청크는 건드리지 않음)"""
+        chunk = json.dumps([[role, content] for role, content in messages], ensure_ascii=False)
+        self.archive += (zlib.compress(chunk.encode("utf-8")),)
+
+    def transcript(self) -> List[Dict[str, str]]:
+        """
+        전체 대화 기록 (압축 해제 포함, 진행 중인 턴이 끝날 때까지 대기)
+        Returns:
+            [{"role": ..., "content": ...}, ...]
+        """
+        with self.lock:
+            archive, recent = self.archive, self.recent
+
+        messages = []
+        for chunk in archive:
+            messages.extend(
+                {"role": role, "content": content}
+                for role, content in json.loads(zlib.decompress(chunk))
+            )
+        messages.extend({"role": role, "content": content} for role, content in recent)
+        return messages
+
+    def _measure(self) -> int:
+        """
+        세션이 단독으로 점유하는 바이트 수 (근사값)
+        공유 문자열/클라이언트/프롬프트는 제외하고, order_context 값은 한 단계만 측정
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self.customer_name) + sys.getsizeof(self.lock)
+        size += sys.getsizeof(self.recent) + sys.getsizeof(self.archive)
+        size += sum(sys.getsizeof(chunk) for chunk in self.archive)
+
+        for pair in self.recent:
+            size += sys.getsizeof(pair) + sys.getsizeof(pair[1])
+
+        if self.order_context:
+            size += sys.getsizeof(self.order_context)
+            for value in self.order_context.values():
+                size += sys.getsizeof(value)
+
+        return size
+
+
+def _intern_role(role: str) -> str:
+    """역할 문자열을 공유 상수로 치환"""
+    if role == ROLE_USER:
+        return ROLE_USER
+    if role == ROLE_ASSISTANT:
+        return ROLE_ASSISTANT
+    return sys.intern(role)
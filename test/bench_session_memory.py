@@ -0,0 +1,139 @@
+"""
+세션 메모리 벤치마크 스크립트
+기존 세션 표현(DialogManager + 세션 dict)과 압축 세션 표현(SessionState)의
+세션당 메모리와 1GB에 들어가는 세션 수를 비교 (Groq API 호출 없음)
+"""
+import os
+import sys
+import tracemalloc
+from importlib.metadata import version
+
+# 프로젝트 루트 경로 (test 폴더의 상위 디렉토리)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 모듈 경로 추가
+sys.path.insert(0, project_root)
+
+from ai_module.conversation.dialog_manager import DialogManager
+from ai_module.conversation.prompt_registry import DEFAULT_PROMPT_PATH, prompt_registry
+from api.app.services.session_state import SessionState
+
+SESSION_COUNT = 200
+TURN_COUNT = 10
+GIGABYTE = 1024 ** 3
+
+# 예시 대화 (system_prompt.txt의 대화 흐름)
+SAMPLE_TURNS = [
+    ("디너 추천해줘", "무슨 기념일인가요?"),
+    ("내일이 어머니 생신이에요", "축하드립니다! 프렌치 디너나 샴페인 축제 디너 추천드려요. 어떤 게 좋으실까요?"),
+    ("샴페인 축제 디너로 할게요", "좋은 선택이세요! 그랜드 스타일과 디럭스 스타일 중 어떤 걸로 하시겠어요?"),
+    ("디럭스로 주세요", "샴페인 축제 디너, 디럭스 스타일로 주문하시는 거 맞으시죠?"),
+    ("네 맞아요", "추가로 필요하신 건 없으세요?"),
+]
+
+SAMPLE_ORDER = {
+    "dinner_type": "샴페인 축제 디너",
+    "serving_style": "deluxe",
+    "champagne_count": 1,
+    "baguette_count": 4,
+    "coffee_pot_count": 1,
+    "wine_count": 1,
+    "steak_count": 2,
+    "serves_count": 2,
+}
+
+
+def sample_turn(session_index: int, turn_index: int) -> tuple[str, str]:
+    """세션/턴마다 다른 문자열을 만들어 문자열 공유 효과를 배제"""
+    user, assistant = SAMPLE_TURNS[turn_index % len(SAMPLE_TURNS)]
+    return f"{user} ({session_index}-{turn_index})", f"{assistant} ({session_index}-{turn_index})"
+
+
+def build_legacy_sessions() -> list:
+    """기존 표현: 세션마다 Groq 클라이언트, 프롬프트 사본, 메시지 dict, 중복 히스토리"""
+    sessions = []
+    for i in range(SESSION_COUNT):
+        dialog_manager = DialogManager()
+        dialog_manager.start_conversation(f"고객{i}")
+
+        # 기존 구조는 세션마다 프롬프트 파일을 읽어 사본을 보관
+        with open(DEFAULT_PROMPT_PATH, "r", encoding="utf-8") as f:
+            dialog_manager.last_system_prompt = f.read()
+
+        session = {
+            "customer_name": f"고객{i}",
+            "dialog_manager": dialog_manager,
+            "conversation_history": []
+        }
+        for t in range(TURN_COUNT):
+            user, assistant = sample_turn(i, t)
+            dialog_manager.conversation_history.append({"role": "user", "content": user})
+            dialog_manager.conversation_history.append({"role": "assistant", "content": assistant})
+            session["conversation_history"].append({
+                "user": user,
+                "assistant": assistant,
+                "order_data": None
+            })
+        dialog_manager.update_order_context(dict(SAMPLE_ORDER))
+        sessions.append(session)
+    return sessions
+
+
+def build_compact_sessions() -> list:
+    """압축 표현: SessionState + 턴 실행 중에만 DialogManager 생성"""
+    client = DialogManager().client
+    sessions = []
+    for i in range(SESSION_COUNT):
+        state = SessionState(f"고객{i}", "default")
+        for t in range(TURN_COUNT):
+            user, assistant = sample_turn(i, t)
+            dialog_manager = state.materialize(client)
+            dialog_manager.conversation_history.append({"role": "user", "content": user})
+            dialog_manager.conversation_history.append({"role": "assistant", "content": assistant})
+            if t == TURN_COUNT - 1:
+                dialog_manager.update_order_context(dict(SAMPLE_ORDER))
+            state.absorb(dialog_manager)
+        sessions.append(state)
+    return sessions
+
+
+def measure(builder) -> tuple[int, list]:
+    """builder가 만든 세션들이 유지하는 메모리 (바이트)"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    sessions = builder()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before, sessions
+
+
+def main():
+    """메인 함수"""
+    # API 호출은 없으므로 키가 없으면 임의 값 사용
+    os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+    # 공유 프롬프트는 측정 전에 로드
+    prompt_registry.reload()
+
+    print("\n" + "="*60)
+    print(f"  세션 메모리 벤치마크 ({SESSION_COUNT}세션 x {TURN_COUNT}턴)")
+    print(f"  Python {sys.version.split()[0]}, groq {version('groq')}, httpx {version('httpx')}")
+    print("="*60)
+
+    results = {}
+    for name, builder in (("기존", build_legacy_sessions), ("압축", build_compact_sessions)):
+        total, sessions = measure(builder)
+        per_session = total / SESSION_COUNT
+        results[name] = per_session
+        print(f"\n[{name}] 세션당 {per_session:,.0f} bytes -> 1GB당 {GIGABYTE / per_session:,.0f}세션")
+        if name == "압축":
+            accounted = sum(state.nbytes for state in sessions) / SESSION_COUNT
+            print(f"       /api/health 집계값: 세션당 {accounted:,.0f} bytes")
+        del sessions
+
+    print(f"\n[비교] {results['기존'] / results['압축']:.1f}배 더 많은 세션 수용")
+    print("="*60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
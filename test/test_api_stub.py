@@ -0,0 +1,374 @@
+"""
+Groq 스텁 클라이언트 API 점검 스크립트
+(Groq API 호출 없이 배치 처리 순서/오류 응답, 출력 예산/이어쓰기, 세션 압축 등을 확인)
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+# 프로젝트 루트 경로 (test 폴더의 상위 디렉토리)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 모듈 경로 추가
+sys.path.insert(0, project_root)
+
+# API 호출은 없으므로 키가 없으면 임의 값 사용
+os.environ.setdefault("GROQ_API_KEY", "stub")
+
+from fastapi.testclient import TestClient
+
+from ai_module.conversation.dialog_manager import (
+    CONTINUATION_MAX_TOKENS,
+    ORDER_DATA_END,
+    ORDER_DATA_MAX_TOKENS,
+    QUESTION_MAX_TOKENS,
+    DialogManager,
+)
+from ai_module.conversation.prompt_registry import prompt_registry
+from api.app.main import app
+from api.app.models.schemas import MAX_BATCH_SIZE
+from api.app.routes.chat import BATCH_MAX_CONCURRENCY
+from api.app.services.profiler import profiler
+from api.app.services.session_manager import session_manager
+from api.app.services.session_state import ARCHIVE_THRESHOLD, RECENT_MESSAGES
+
+
+class StubCompletions:
+    """
+    Groq chat.completions 스텁
+    - 기본: 마지막 사용자 발화를 "echo:<발화>"로 응답
+    - script에 넣은 (content, finish_reason)이 있으면 순서대로 응답
+    """
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.script = []
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+            scripted = self.script.pop(0) if self.script else None
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        time.sleep(self.delay)
+
+        with self._lock:
+            self.in_flight -= 1
+
+        if scripted:
+            content, finish_reason = scripted
+        else:
+            content, finish_reason = f"echo:{kwargs['messages'][-1]['content']}", "stop"
+
+        return SimpleNamespace(choices=[
+            SimpleNamespace(message=SimpleNamespace(content=content), finish_reason=finish_reason)
+        ])
+
+
+def stub_client(delay: float = 0.0) -> SimpleNamespace:
+    """Groq 클라이언트 스텁"""
+    return SimpleNamespace(chat=SimpleNamespace(completions=StubCompletions(delay)))
+
+
+def post_batch(client: TestClient, turns: list) -> list:
+    """배치 요청 후 NDJSON 결과 목록 반환"""
+    response = client.post("/api/chat/batch", json={"turns": turns})
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def recent_contents(session_id: str) -> list:
+    """세션 최근 메시지 내용"""
+    return [content for _, content in session_manager.get_session(session_id).recent]
+
+
+def check_batch_order_and_errors(client: TestClient):
+    """배치: 세션 내 순서 유지, 오류 턴은 error 필드로 반환"""
+    session_id = client.post("/api/chat/start", json={"customer_name": "배치"}).json()["session_id"]
+
+    results = post_batch(client, [
+        {"session_id": session_id, "text": "a"},
+        {"session_id": "missing", "text": "b"},
+        {"session_id": session_id, "text": "c"},
+        {"session_id": session_id, "text": "   "},
+    ])
+
+    by_index = {result["index"]: result for result in results}
+    assert sorted(by_index) == [0, 1, 2, 3]
+    assert by_index[0]["response"]["text"] == "echo:a"
+    assert by_index[2]["response"]["text"] == "echo:c"
+    assert by_index[1]["error"] == "세션을 찾을 수 없습니다."
+    assert by_index[3]["error"] == "텍스트가 비어있습니다."
+    assert recent_contents(session_id) == ["a", "echo:a", "c", "echo:c"]
+
+    print("[OK] 배치 순서/오류 응답")
+
+
+def check_batch_limits(client: TestClient):
+    """배치/일괄 요청 크기 제한, 전체 배치 동시 실행 수 제한"""
+    too_many_turns = [{"session_id": "x", "text": "a"}] * (MAX_BATCH_SIZE + 1)
+    assert client.post("/api/chat/batch", json={"turns": too_many_turns}).status_code == 422
+
+    too_many_names = ["a"] * (MAX_BATCH_SIZE + 1)
+    assert client.post("/api/chat/start/bulk", json={"customer_names": too_many_names}).status_code == 422
+
+    names = [f"동시성{i}" for i in range(BATCH_MAX_CONCURRENCY * 2)]
+    sessions = client.post("/api/chat/start/bulk", json={"customer_names": names}).json()["sessions"]
+
+    completions = session_manager._client.chat.completions
+    completions.max_in_flight = 0
+    results = post_batch(client, [{"session_id": s["session_id"], "text": "c"} for s in sessions])
+
+    assert len(results) == len(sessions)
+    assert all(result["error"] is None for result in results)
+    assert 1 < completions.max_in_flight <= BATCH_MAX_CONCURRENCY, completions.max_in_flight
+
+    print("[OK] 배치 크기/동시 실행 제한")
+
+
+def check_batch_unexpected_error_does_not_hang(client: TestClient):
+    """스레드풀 밖에서 예외가 나도 턴마다 오류 줄을 보내고 스트림 종료"""
+    session_id = client.post("/api/chat/start", json={"customer_name": "예외"}).json()["session_id"]
+    original_get_session = session_manager.get_session
+
+    def broken_get_session(sid):
+        if sid == session_id:
+            raise RuntimeError("boom")
+        return original_get_session(sid)
+
+    session_manager.get_session = broken_get_session
+    try:
+        results = post_batch(client, [
+            {"session_id": session_id, "text": "a"},
+            {"session_id": session_id, "text": "b"},
+        ])
+    finally:
+        session_manager.get_session = original_get_session
+
+    assert sorted(result["index"] for result in results) == [0, 1]
+    assert all(result["error"] == "메시지 처리 실패: boom" for result in results)
+
+    print("[OK] 배치 예기치 않은 오류 시 스트림 종료")
+
+
+def check_concurrent_requests_same_session(client: TestClient):
+    """서로 다른 요청이 같은 세션에 동시에 들어와도 턴이 유실되지 않음"""
+    session_id = client.post("/api/chat/start", json={"customer_name": "동시"}).json()["session_id"]
+
+    def send_batch(text):
+        post_batch(client, [{"session_id": session_id, "text": text}])
+
+    def send_message(text):
+        response = client.post("/api/chat/message", json={"session_id": session_id, "text": text})
+        assert response.status_code == 200, response.text
+
+    threads = [
+        threading.Thread(target=send_batch, args=("r0",)),
+        threading.Thread(target=send_batch, args=("r1",)),
+        threading.Thread(target=send_message, args=("r2",)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    contents = recent_contents(session_id)
+    for text in ("r0", "r1", "r2"):
+        assert text in contents and f"echo:{text}" in contents, contents
+        # 각 턴의 응답은 자기 발화 바로 뒤에 위치
+        assert contents[contents.index(text) + 1] == f"echo:{text}", contents
+
+    print("[OK] 같은 세션 동시 요청")
+
+
+def check_removed_tenant_keeps_session(client: TestClient):
+    """리로드로 테넌트 파일이 삭제돼도 진행 중인 세션은 마지막 프롬프트로 계속 진행"""
+    with tempfile.TemporaryDirectory() as tenants_dir:
+        prompt_registry._tenants_dir = tenants_dir
+        prompt_path = os.path.join(tenants_dir, "brand_b.txt")
+        with open(prompt_path, "w", encoding="utf-8") as f:
+            f.write("brand b prompt")
+        prompt_registry.reload()
+
+        response = client.post("/api/chat/start", json={"customer_name": "테넌트", "tenant_id": "brand_b"})
+        session_id = response.json()["session_id"]
+        assert client.post("/api/chat/message", json={"session_id": session_id, "text": "t1"}).status_code == 200
+
+        os.remove(prompt_path)
+        prompt_registry.reload()
+        assert not prompt_registry.has_tenant("brand_b")
+
+        response = client.post("/api/chat/message", json={"session_id": session_id, "text": "t2"})
+        assert response.status_code == 200, response.text
+        assert response.json()["text"] == "echo:t2"
+
+        # 새 세션은 만들 수 없음
+        response = client.post("/api/chat/start", json={"customer_name": "테넌트", "tenant_id": "brand_b"})
+        assert response.status_code == 400
+
+        calls = session_manager._client.chat.completions.calls
+        assert calls[-1]["messages"][0]["content"].startswith("brand b prompt")
+
+    prompt_registry._tenants_dir = None
+    prompt_registry.reload()
+
+    print("[OK] 삭제된 테넌트의 진행 중인 세션 유지")
+
+
+def check_session_archive_and_transcript(client: TestClient):
+    """오래된 메시지는 압축 청크로 보관되고 transcript로 순서대로 복원"""
+    session_id = client.post("/api/chat/start", json={"customer_name": "기록"}).json()["session_id"]
+    texts = [f"t{i}" for i in range(10)]
+
+    post_batch(client, [{"session_id": session_id, "text": text} for text in texts])
+
+    state = session_manager.get_session(session_id)
+    assert len(state.recent) <= ARCHIVE_THRESHOLD
+    assert len(state.archive) >= 1
+    assert [content for _, content in state.recent][-2:] == ["t9", "echo:t9"]
+
+    # DialogManager에는 최근 메시지만 전달
+    calls = session_manager._client.chat.completions.calls
+    last_messages = [m for m in calls[-1]["messages"] if m["role"] != "system"]
+    assert len(last_messages) <= RECENT_MESSAGES + 1
+
+    expected = []
+    for text in texts:
+        expected += [{"role": "user", "content": text}, {"role": "assistant", "content": f"echo:{text}"}]
+
+    response = client.get(f"/api/chat/transcript/{session_id}")
+    assert response.status_code == 200, response.text
+    assert response.json()["messages"] == expected
+    assert client.get("/api/chat/transcript/missing").status_code == 404
+
+    assert client.get("/api/health").json()["session_memory"]["bytes_per_session"] > 0
+
+    print("[OK] 세션 압축 보관/대화 기록 복원")
+
+
+def check_profile_header_requires_admin(client: TestClient):
+    """X-Profile 헤더는 관리자 토큰이 맞을 때만 프로파일링"""
+    session_id = client.post("/api/chat/start", json={"customer_name": "프로파일"}).json()["session_id"]
+    previous_dir = profiler.profile_dir
+    os.environ["ADMIN_TOKEN"] = "stub-admin"
+
+    with tempfile.TemporaryDirectory() as profile_dir:
+        profiler.profile_dir = profile_dir
+
+        for headers in ({"X-Profile": "1"}, {"X-Profile": "1", "X-Admin-Token": "wrong"}):
+            response = client.post("/api/chat/message", json={"session_id": session_id, "text": "p"}, headers=headers)
+            assert response.status_code == 200, response.text
+        assert profiler.list_profiles() == []
+
+        headers = {"X-Profile": "1", "X-Admin-Token": "stub-admin"}
+        response = client.post("/api/chat/message", json={"session_id": session_id, "text": "p"}, headers=headers)
+        assert response.status_code == 200, response.text
+        assert len(profiler.list_profiles()) == 2  # .prof + .txt
+
+    profiler.profile_dir = previous_dir
+    del os.environ["ADMIN_TOKEN"]
+
+    print("[OK] 프로파일 헤더 관리자 토큰 필요")
+
+
+def new_dialog_manager() -> DialogManager:
+    """스텁 클라이언트를 쓰는 DialogManager"""
+    dialog_manager = DialogManager(client=stub_client())
+    dialog_manager.start_conversation("스텁")
+    return dialog_manager
+
+
+def check_output_budget_and_stop():
+    """질문 턴은 작은 예산, 배달 날짜 턴은 큰 예산, 항상 정지 시퀀스 전달"""
+    dialog_manager = new_dialog_manager()
+    calls = dialog_manager.client.chat.completions.calls
+
+    dialog_manager.process_user_input("디너 추천해줘")
+    assert calls[-1]["max_tokens"] == QUESTION_MAX_TOKENS
+    assert calls[-1]["stop"] == [ORDER_DATA_END]
+
+    dialog_manager.process_user_input("내일 18시에 주세요")
+    assert calls[-1]["max_tokens"] == ORDER_DATA_MAX_TOKENS
+
+    # 직전 응답이 배달 날짜 질문이면 큰 예산
+    dialog_manager.conversation_history.append({"role": "assistant", "content": "언제 배달해드릴까요?"})
+    dialog_manager.process_user_input("네")
+    assert calls[-1]["max_tokens"] == ORDER_DATA_MAX_TOKENS
+
+    print("[OK] 단계별 출력 예산/정지 시퀀스")
+
+
+def check_order_data_continuation():
+    """잘린 ORDER_DATA 블록은 한 번 이어서 생성하고 닫는 태그를 복원"""
+    dialog_manager = new_dialog_manager()
+    completions = dialog_manager.client.chat.completions
+    completions.script = [
+        ('주문 완료! [ORDER_DATA]\n{"dinner_type": "프렌치 디너", "deli', "length"),
+        ('very_date": "내일 18시"}\n', "stop"),
+    ]
+
+    response, order_data = dialog_manager.process_user_input("내일 18시")
+
+    assert len(completions.calls) == 2
+    continuation = completions.calls[1]
+    assert continuation["max_tokens"] == CONTINUATION_MAX_TOKENS
+    assert continuation["messages"][-1]["role"] == "assistant"
+    assert response == "주문 완료!"
+    assert order_data["dinner_type"] == "프렌치 디너"
+    assert order_data["delivery_date"].hour == 18
+    assert dialog_manager.conversation_history[-1]["content"].endswith(ORDER_DATA_END)
+
+    print("[OK] ORDER_DATA 이어쓰기/닫는 태그 복원")
+
+
+def check_plain_reply_continuation():
+    """일반 응답이 잘려도 한 번 이어서 생성"""
+    dialog_manager = new_dialog_manager()
+    completions = dialog_manager.client.chat.completions
+    completions.script = [
+        ("발렌타인 디너, 프렌치 디너, 잉글리시", "length"),
+        (" 디너, 샴페인 축제 디너가 있어요.", "stop"),
+    ]
+
+    response, order_data = dialog_manager.process_user_input("메뉴 알려줘")
+
+    assert len(completions.calls) == 2
+    assert response == "발렌타인 디너, 프렌치 디너, 잉글리시 디너, 샴페인 축제 디너가 있어요."
+    assert order_data is None
+
+    print("[OK] 일반 응답 이어쓰기")
+
+
+def main():
+    """메인 함수"""
+    check_output_budget_and_stop()
+    check_order_data_continuation()
+    check_plain_reply_continuation()
+
+    with TestClient(app) as client:
+        # 세션 생성 전에 공유 클라이언트를 스텁으로 교체
+        session_manager._client = stub_client(delay=0.05)
+
+        check_batch_order_and_errors(client)
+        check_batch_limits(client)
+        check_batch_unexpected_error_does_not_hang(client)
+        check_concurrent_requests_same_session(client)
+        check_removed_tenant_keeps_session(client)
+        check_session_archive_and_transcript(client)
+        check_profile_header_requires_admin(client)
+
+    print("\n모든 점검 통과")
+
+
+if __name__ == "__main__":
+    main()